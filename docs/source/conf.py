@@ -10,7 +10,6 @@ from command_creator import _info
 from datetime import datetime
 import importlib.util
 import pathlib
-import io
 import sys
 
 project = 'Command Creator'
@@ -28,6 +27,7 @@ extensions = [
   'sphinx.ext.napoleon',
 ]
 autosummary_generate = True  # Turn on sphinx.ext.autosummary
+autosummary_ignore_module_all = False  # Document the re-exports listed in __all__
 
 templates_path = ['_templates']
 exclude_patterns = []
@@ -51,7 +51,4 @@ sys.modules["examples.example"] = _examples
 _examples_spec.loader.exec_module(_examples)
 
 with open(_tmp_dir.joinpath("example.out"), "w") as f:
-  parser = _examples.CommandName.create_parser()
-  str_io = io.StringIO()
-  parser.print_help(str_io)
-  f.write(str_io.getvalue())
+  f.write(_examples.CommandName.create_parser().format_help())
@@ -0,0 +1,805 @@
+#####################################################################################
+# A package to simplify the creation of Python Command-Line tools
+# Copyright (C) 2023  Benjamin Davis
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <https://www.gnu.org/licenses/>.
+#####################################################################################
+
+from __future__ import annotations
+from typing import (
+    Any, Callable, Mapping, TypeVar, Type, ClassVar, NoReturn, TypedDict,
+    List, Dict, Tuple, Optional, Union, TYPE_CHECKING, overload
+)
+from collections.abc import Sequence
+import types
+
+import os
+import re
+import sys
+import functools
+import dataclasses
+from dataclasses import Field, MISSING, fields
+from enum import Enum
+from abc import ABC, abstractmethod
+
+from argparse import ArgumentParser, Namespace, Action
+
+from ._errors import InvalidArgumentError
+
+
+#####################################################################################
+# Optional Dependencies
+#####################################################################################
+@functools.lru_cache(maxsize=None)
+def _get_argcomplete() -> types.ModuleType | None:
+    """Import the optional argcomplete package on first use
+
+    Returns:
+        types.ModuleType | None: The argcomplete module, None if it is not installed
+    """
+    try:
+        import argcomplete
+    except ImportError:
+        return None
+    return argcomplete
+
+
+#####################################################################################
+# General Type-Hinting
+#####################################################################################
+class CompleterArgs(TypedDict):
+    prefix: str
+    action: Action
+    parser: ArgumentParser
+    parsed_args: Namespace
+
+
+CompleterList = List[str]
+CompleterDict = Dict[str, str]
+CompleterIter = Union[CompleterList, CompleterDict]
+if sys.version_info < (3, 11):
+    CompleterFunc = Callable[..., CompleterIter]
+else:
+    from typing import Unpack
+    CompleterFunc = Callable[[Unpack[CompleterArgs]], CompleterIter]
+
+Completer = Union[CompleterFunc, CompleterDict, CompleterList]
+
+_ArgSpec = Tuple[Tuple[str, ...], Dict[str, Any], Optional[Callable[..., Any]]]
+_ValueSpec = Tuple["CmdArgument", bool, Optional[Type[Enum]]]
+
+
+#####################################################################################
+# Type Inspection
+#####################################################################################
+_SCALAR_TYPES: dict[str, type] = {"str": str, "int": int, "float": float, "bool": bool}
+_UNION_TYPE: Any = getattr(types, "UnionType", None)
+_LIST_PREFIXES = ("list[", "List[")
+_QUALIFIER = re.compile(r"\b[A-Za-z_]\w*\.")
+"""Matches a module qualifier such as typing. or t. in a type hint string"""
+
+
+def _split_members(hint: str, sep: str) -> list[str]:
+    """Split a type hint string on a separator, ignoring separators inside brackets
+
+    Args:
+        hint (str): The type hint string to split, e.g. "int | list[str]"
+        sep (str): The single character separator to split on, e.g. "|" or ","
+
+    Returns:
+        list[str]: The members of the hint in order, with surrounding whitespace kept
+    """
+    members = []
+    depth = 0
+    start = 0
+    for idx, char in enumerate(hint):
+        if char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+        elif char == sep and depth == 0:
+            members.append(hint[start:idx])
+            start = idx + 1
+    members.append(hint[start:])
+    return members
+
+
+@functools.lru_cache(maxsize=256)
+def _classify(hint: Any) -> tuple[type | None, bool]:
+    """Classify the type hint of an argument
+
+    Optional and Union-with-None hints are reduced to the wrapped type. The same hints show
+    up across many arguments, so the results are cached.
+
+    Args:
+        hint (Any): The type hint, either the annotation string or the evaluated type
+
+    Returns:
+        tuple[type | None, bool]: The scalar type (str, int, float or bool) of the argument,
+            or None if it is not one of those, and whether the argument is a list
+    """
+    if not isinstance(hint, str):
+        # Read the alias attributes directly, X | Y (types.UnionType) has no __origin__
+        origin = getattr(hint, "__origin__", None)
+        hint_args = getattr(hint, "__args__", ())
+        if hasattr(hint, "__metadata__"):
+            # Annotated[X, ...] keeps X as its __origin__
+            return _classify(origin)
+        if origin is Union or type(hint) is _UNION_TYPE:
+            members = [a for a in hint_args if a is not type(None)]
+            return _classify(members[0]) if len(members) == 1 else (None, False)
+        if origin is list or hint is list:
+            return (_classify(hint_args[0])[0] if hint_args else None), True
+        return (hint if hint in _SCALAR_TYPES.values() else None), False
+
+    hint = _QUALIFIER.sub("", hint.replace(" ", ""))
+    if hint.startswith(("Optional[", "Union[")) and hint.endswith("]"):
+        members = _split_members(hint[hint.index("[") + 1:-1], ",")
+    else:
+        members = _split_members(hint, "|")
+    members = [m for m in members if m != "None"]
+    if len(members) != 1:
+        return None, False
+
+    member = members[0]
+    if member.startswith("Annotated[") and member.endswith("]"):
+        return _classify(_split_members(member[len("Annotated["):-1], ",")[0])
+    if member.startswith(_LIST_PREFIXES) and member.endswith("]"):
+        return _classify(member[member.index("[") + 1:-1])[0], True
+    if member in ("list", "List"):
+        return None, True
+    return _SCALAR_TYPES.get(member), False
+
+
+#####################################################################################
+# Command Argument
+#####################################################################################
+_EMPTY_METADATA: Mapping[Any, Any] = types.MappingProxyType({})
+"""Shared read-only default for the metadata of arguments"""
+_HAS_KW_ONLY = sys.version_info >= (3, 10)
+"""Whether dataclasses.Field takes a kw_only argument"""
+
+
+class CmdArgument(Field):
+    """Class which represents a command-line argument
+    """
+    __slots__ = (
+        "help", "abrv", "choices", "optional", "positional", "count", "completer", "metavar"
+    )
+
+    def __init__(
+                self,
+                help: str = "",
+                abrv: str | None = None,
+                choices: list[Any] | type[Enum] | None = None,
+                metavar: str | None = None,
+                optional: bool = False,
+                positional: bool = False,
+                default: Any = MISSING,
+                default_factory: Callable[[], Any] = MISSING,  # type: ignore[assignment]
+                init: bool = True,
+                repr: bool = True,
+                hash: bool | None = None,
+                compare: bool = True,
+                count: bool = False,
+                completer: Completer | None = None,
+                metadata: Mapping[Any, Any] = _EMPTY_METADATA,
+                **kwargs: Any
+            ) -> None:
+        if _HAS_KW_ONLY:
+            kwargs.setdefault("kw_only", False)
+
+        super().__init__(default, default_factory, init, repr, hash, compare, metadata, **kwargs)
+
+        self.help = help
+        """The help string used for the argument"""
+        self.abrv = abrv
+        self.choices = choices
+        self.metavar = metavar
+        self.optional = optional
+        self.positional = positional
+        self.count = count
+        self.completer = completer
+
+    def __repr__(self) -> str:
+        ret_val = "CmdArgument("
+        ret_val += f"name={self.name},"
+        for slot in CmdArgument.__slots__:
+            ret_val += f"{slot}={getattr(self, slot)},"
+        ret_val +=  ")"
+        return ret_val
+
+    def get_default(self) -> Any | None:
+        if self.default is not MISSING:
+            return self.default
+        elif self.default_factory is not MISSING:
+            return self.default_factory()
+        return None
+
+
+def arg(
+            help: str = "",
+            abrv: str | None = None,
+            choices: list[str] | type[Enum] | None = None,
+            metavar: str | None = None,
+            optional: bool = False,
+            positional: bool = False,
+            default: Any = MISSING,
+            default_factory: Callable[[], Any] = MISSING,  # type: ignore[assignment]
+            init: bool = True,
+            repr: bool = True,
+            hash: bool | None = None,
+            count: bool = False,
+            compare: bool = True,
+            completer: Completer | None = None,
+            metadata: Mapping[Any, Any] = _EMPTY_METADATA,
+            **kwargs: Any
+        ) -> Any:
+    """Create a command-line argument
+
+    Args:
+            help (str, optional): Help message for the argument. Defaults to empty string.
+            abrv (str | None, optional): Abbreviation for the argument. Defaults to None.
+            choices (list[str] | Enum | None, optional): List of choices for the argument.
+                Defaults to None.
+            metavar (str | None) : The metavar to use when displaying argument help info.
+                Defaults to None.
+            optional (bool, optional): Whether the argument is optional. Default to False.
+            positional (bool, optional): Whether the argument is positional. Defaults to False.
+            default (Any, optional): Default value for the argument. Defaults to MISSING.
+            default_factory (Callable[[], Any], optional): Default factory for the argument.
+                Defaults to MISSING.
+            init (bool, optional): Whether the argument is included in the __init__ method.
+                Defaults to True.
+            repr (bool, optional): Whether the argument is included in the __repr__ method.
+                Defaults to True.
+            hash (bool | None, optional): Whether the argument is included in the __hash__ method.
+                Defaults to None.
+            count (bool, optional): Whether the argument should be a count of the times it appears
+                Defaults to False.
+            compare (bool, optional): Whether the argument is included in the __eq__ method.
+                Defaults to True.
+            completer (Completer | None): A completer which can be used for argcomplete.
+                Defaults to None.
+            metadata (Mapping[Any, Any], optional): Metadata for the argument.
+                Defaults to an empty read-only mapping.
+            **kwargs (Any): Additional keyword arguments for the argument.
+
+    Returns:
+            Any: The command-line argument
+    """
+    return CmdArgument(
+        help=help,
+        abrv=abrv,
+        choices=choices,
+        metavar=metavar,
+        optional=optional,
+        positional=positional,
+        default=default,
+        default_factory=default_factory,
+        init=init,
+        repr=repr,
+        hash=hash,
+        compare=compare,
+        count=count,
+        completer=completer,
+        metadata=metadata,
+        **kwargs
+    )
+
+
+#####################################################################################
+# Command Class
+#####################################################################################
+_SUB_COMMAND_CHAIN = "_cc_sub_command_chain"
+"""Namespace attribute holding the selected sub-commands, outermost first"""
+
+_COMMAND_DATACLASS_KWARGS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+"""Python 3.10+ lets the Command base class use __slots__ for its fields"""
+
+
+@dataclasses.dataclass(**_COMMAND_DATACLASS_KWARGS)
+class Command(ABC):
+    """Class which represents a command-line command
+    """
+
+    sub_commands: ClassVar[Mapping[str, Type[Command]]] = types.MappingProxyType({})
+    """A dictionary mapping the sub-command name to the respective sub-command
+
+    Sub-classes assign their own dictionary; the default is read-only so it is never shared
+    """
+    sub_command: Command | None
+    """The sub-command found during argument parsing. None if one not found"""
+
+    _cc_cmd_args: ClassVar[tuple[CmdArgument, ...]]
+    """Cache of the validated command-line arguments, see _get_cmd_args"""
+    _cc_argspecs: ClassVar[dict[bool, tuple[_ArgSpec, ...]]]
+    """Cache of the argparse specifications keyed by doc_mode, see _get_argspecs"""
+    _cc_value_specs: ClassVar[tuple[_ValueSpec, ...]]
+    """Cache of the value conversions done by from_args, see _get_value_specs"""
+    _cc_parser: ClassVar[ArgumentParser]
+    """Cache of the parser used by parse_args, see _get_parser"""
+
+    def __post_init__(self) -> None:
+        """This method may be implemented by subclasses in order to setup variables or
+        post-process any user inputs
+        """
+        pass
+
+    @abstractmethod
+    def __call__(self) -> int:
+        """This method must be implemented by subclasses, it is the method which is called
+        to execute the command
+        """
+        pass
+
+    @classmethod
+    def create_parser(cls: Type[CommandT], doc_mode: bool = False) -> ArgumentParser:
+        """Create the argument parser for the Command using argparser library
+
+        A new parser is returned on every call, so callers are free to modify it.
+
+        Args:
+            doc_mode (bool, optional): Whether to force meta-data use for prettier documentation.
+                Defaults to False.
+
+        Returns:
+            ArgumentParser: The argument-parser derived from the class definition
+        """
+        parser = ArgumentParser(
+            prog=cls.__name__.lower(),
+            description=cls.__doc__,
+        )
+        cls._add_args(parser, doc_mode)
+        cls._add_sub_commands(parser, doc_mode)
+        return parser
+
+    @classmethod
+    def _get_parser(cls) -> ArgumentParser:
+        """Get the argument parser used by parse_args
+
+        The parser is built on the first call and cached in the class's own __dict__, so
+        sub_commands must be complete before the command is first parsed.
+
+        Returns:
+            ArgumentParser: The shared argument-parser, which must not be modified
+        """
+        parser = cls.__dict__.get("_cc_parser")
+        if parser is None:
+            parser = cls._cc_parser = cls.create_parser()
+        return parser
+
+    @classmethod
+    def _get_cmd_args(cls) -> tuple[CmdArgument, ...]:
+        """Get the command-line arguments of the command
+
+        The fields are validated on the first call and the result is cached in the class's
+        own __dict__, so sub-classes never see the arguments of their parent.
+
+        Returns:
+            tuple[CmdArgument, ...]: The command-line arguments in definition order
+        """
+        cmd_args = cls.__dict__.get("_cc_cmd_args")
+        if cmd_args is not None:
+            return cmd_args
+
+        cmd_args_list: list[CmdArgument] = []
+        for fld in fields(cls):
+            if fld.name == "sub_command":
+                continue
+            if not isinstance(fld, CmdArgument):
+                raise InvalidArgumentError(
+                    f"Field {fld.name} is not a CmdArgument" +
+                    " Did you use field() instead of arg()?"
+                )
+
+            # Determine whether the argument is positional
+            if fld.positional and fld.count:
+                raise ValueError("fld.positional and fld.count cannot both be true")
+
+            if not fld.positional and not fld.count:
+                if fld.default is MISSING and fld.default_factory is MISSING:
+                    fld.positional = True
+
+            cmd_args_list.append(fld)
+
+        cls._cc_cmd_args = tuple(cmd_args_list)
+        return cls._cc_cmd_args
+
+    @classmethod
+    def _get_argspecs(cls, doc_mode: bool = False) -> tuple[_ArgSpec, ...]:
+        """Get the argparse specification of each command-line argument
+
+        Each entry holds the positional and keyword arguments for parser.add_argument as well
+        as the completer to attach to the resulting action. The specification only depends
+        on the class definition, so it is computed once and cached in the class's own __dict__.
+
+        Args:
+            doc_mode (bool): Force the args to use metavars instead of options
+
+        Returns:
+            tuple[_ArgSpec, ...]: The argument specifications in definition order
+        """
+        argspecs = cls.__dict__.get("_cc_argspecs")
+        if argspecs is None:
+            argspecs = cls._cc_argspecs = dict()
+        elif doc_mode in argspecs:
+            return argspecs[doc_mode]
+
+        specs: list[_ArgSpec] = []
+        for fld in cls._get_cmd_args():
+            name = fld.name
+            default = fld.default
+            fld_choices = fld.choices
+            fld_completer = fld.completer
+            kwargs: dict[str, Any] = dict()
+
+            kind, is_list = _classify(fld.type)  # type: ignore[arg-type]
+
+            if fld.count and (kind is not int or is_list):
+                raise ValueError(f"Field ({name}) with count=True has type {fld.type}!=int")
+
+            if fld.count:
+                kwargs['action'] = 'count'
+            elif is_list:
+                kwargs['nargs'] = '*' if fld.optional else '+'
+            elif kind is bool:
+                is_store_true = default is MISSING or default is False
+                kwargs['action'] = 'store_true' if is_store_true else 'store_false'
+            elif kind is not None:
+                kwargs['type'] = kind
+
+            if fld.optional and not is_list:
+                kwargs['nargs'] = '?'
+
+            choices: list[Any] | None = None
+            if fld_choices is not None:
+                if isinstance(fld_choices, list):
+                    choices = fld_choices
+                elif isinstance(fld_choices, type) and issubclass(fld_choices, Enum):
+                    choices = [
+                        str(e).replace(fld_choices.__name__ + ".", "") for e in fld_choices
+                    ]
+                else:
+                    raise ValueError(
+                        f"Field {name} has an invalid type for choices" +
+                        " Did you use an Enum or a list?"
+                    )
+            elif isinstance(fld_completer, list):
+                choices = fld_completer
+
+            if choices is not None and not doc_mode:
+                kwargs['choices'] = choices
+
+            if choices is not None and doc_mode:
+                kwargs['metavar'] = name.upper()
+            elif fld.metavar is not None:
+                kwargs['metavar'] = fld.metavar
+            elif fld_choices is None and fld_completer is not None:
+                kwargs['metavar'] = name.upper()
+
+            if default is not MISSING:
+                kwargs['default'] = default
+            elif kind is bool and not is_list:
+                kwargs['default'] = False
+
+            kwargs['help'] = fld.help
+
+            if fld.positional:
+                names: tuple[str, ...] = (name,)
+            else:
+                opt_name = name.replace('_', '-')
+                kwargs['dest'] = name
+                if fld.abrv is not None:
+                    names = (f"--{opt_name}", f"-{fld.abrv}")
+                else:
+                    names = (f"--{opt_name}",)
+
+            completer: Callable[..., Any] | None = None
+            if isinstance(fld_completer, dict):
+                def _completer(_completions: CompleterDict = fld_completer, **kwargs: Any) -> Any:
+                    return _completions
+                completer = _completer
+            elif callable(fld_completer):
+                completer = fld_completer
+
+            specs.append((names, kwargs, completer))
+
+        argspecs[doc_mode] = tuple(specs)
+        return argspecs[doc_mode]
+
+    @classmethod
+    def _get_value_specs(cls) -> tuple[_ValueSpec, ...]:
+        """Get how the parsed value of each command-line argument is converted by from_args
+
+        Each entry holds the argument, whether it is a list and the Enum to convert the value
+        to (None if there is no conversion). It is computed once and cached in the class's
+        own __dict__.
+
+        Returns:
+            tuple[_ValueSpec, ...]: The value specifications in definition order
+        """
+        value_specs = cls.__dict__.get("_cc_value_specs")
+        if value_specs is None:
+            value_specs = cls._cc_value_specs = tuple(
+                (
+                    fld,
+                    _classify(fld.type)[1],  # type: ignore[arg-type]
+                    fld.choices if isinstance(fld.choices, type) and issubclass(fld.choices, Enum)
+                    else None,
+                )
+                for fld in cls._get_cmd_args()
+            )
+        return value_specs
+
+    @classmethod
+    def _add_args(cls, parser: ArgumentParser, doc_mode: bool = False) -> None:
+        """Add arguments to the parser
+
+        Args:
+            parser (ArgumentParser): The parser to add arguments to
+            doc_mode (bool): Force the args to use metavars instead of options
+
+        Raises:
+            ValueError: If a completer is provided but argcomplete is not installed
+        """
+        # Only look for argcomplete once a completer actually needs it
+        if any(fld.completer is not None for fld in cls._get_cmd_args()):
+            if _get_argcomplete() is None:
+                raise ValueError("Completer provided without argcomplete package installed...")
+
+        for names, kwargs, completer in cls._get_argspecs(doc_mode):
+            action = parser.add_argument(*names, **kwargs)
+            if completer is not None:
+                action.completer = completer  # type: ignore[attr-defined]
+
+    @classmethod
+    def _add_sub_commands(cls, parser: ArgumentParser, doc_mode: bool = False) -> None:
+        """Add sub-commands to the parser
+
+        Args:
+            parser (ArgumentParser): The parser to add sub-commands to
+            doc_mode (bool): Force the args to use metavars instead of options
+        """
+        if not cls.sub_commands:
+            return
+
+        parsers: dict[tuple[str, ...], ArgumentParser] = {(): parser}
+        sub_parsers: dict[tuple[str, ...], Any] = dict()
+        chains: dict[tuple[str, ...], tuple[Type[Command], ...]] = {(): ()}
+
+        # Parents always precede their children in the dispatch table
+        for path, sub_cmd in cls._get_dispatch().items():
+            parent = path[:-1]
+            if parent not in sub_parsers:
+                sub_parsers[parent] = parsers[parent].add_subparsers(
+                    dest="sub_command",
+                    description="Get help for subcommands with the --help flag"
+                )
+
+            sub_parser = sub_parsers[parent].add_parser(
+                path[-1],
+                description=sub_cmd.__doc__,
+            )
+            # Nested levels all write the same sub_command dest, so record the selected
+            # commands themselves as names may repeat between levels
+            chain = chains[parent] + (sub_cmd,)
+            if len(path) > 1 or sub_cmd.sub_commands:
+                sub_parser.set_defaults(**{_SUB_COMMAND_CHAIN: chain})
+            sub_cmd._add_args(sub_parser, doc_mode)
+            parsers[path] = sub_parser
+            chains[path] = chain
+
+    @classmethod
+    def _get_dispatch(cls) -> dict[tuple[str, ...], Type[Command]]:
+        """Get the flattened sub-command tree of the command
+
+        Maps the path of sub-command names, as given on the command-line, to the respective
+        sub-command.
+
+        Returns:
+            dict[tuple[str, ...], Type[Command]]: The sub-commands keyed by their path
+
+        Raises:
+            ValueError: If a sub-command (indirectly) lists one of its parents as sub-command
+        """
+        dispatch: dict[tuple[str, ...], Type[Command]] = dict()
+        # Each entry also carries the commands on its path to detect cyclic sub_commands
+        pending: list[tuple[tuple[str, ...], Type[Command], tuple[Type[Command], ...]]] = [
+            ((), cls, (cls,))
+        ]
+        while pending:
+            path, cmd, ancestors = pending.pop()
+            for sub_cmd_name, sub_cmd in cmd.sub_commands.items():
+                sub_path = path + (sub_cmd_name,)
+                if sub_cmd in ancestors:
+                    raise ValueError(
+                        f"cyclic sub_commands: {' '.join(sub_path)} leads back to" +
+                        f" {sub_cmd.__name__}"
+                    )
+                dispatch[sub_path] = sub_cmd
+                pending.append((sub_path, sub_cmd, ancestors + (sub_cmd,)))
+
+        return dispatch
+
+    @classmethod
+    def from_args(cls: Type[CommandT], args: Namespace) -> CommandT:
+        """Create a command from a list of arguments
+
+        Args:
+            args (list[str]): The arguments to create the command from
+
+        Returns:
+            CommandT: The created command
+        """
+        if not cls.sub_commands:
+            return cls._from_args(args, None)
+
+        chain = getattr(args, _SUB_COMMAND_CHAIN, None)
+        if chain is None:
+            # A single level of sub-commands only records the name of the selected one
+            sub_cmd_name = getattr(args, "sub_command", None)
+            chain = () if sub_cmd_name is None else (cls.sub_commands[sub_cmd_name],)
+        elif cls in chain:
+            # args was parsed by a parent of cls, so keep the sub-commands below cls
+            chain = chain[chain.index(cls) + 1:]
+
+        # Build the selected sub-commands from the innermost one outwards
+        sub_command: Command | None = None
+        for sub_cmd in reversed(chain):
+            sub_command = sub_cmd._from_args(args, sub_command)
+
+        return cls._from_args(args, sub_command)
+
+    @classmethod
+    def _from_args(
+                cls: Type[CommandT],
+                args: Namespace,
+                sub_command: Command | None
+            ) -> CommandT:
+        """Create a single command from the parsed arguments
+
+        Args:
+            args (Namespace): The parsed arguments to create the command from
+            sub_command (Command | None): The already created sub-command, if any
+
+        Returns:
+            CommandT: The created command
+        """
+        arg_dict: dict[str, Any] = {"sub_command": sub_command}
+
+        for fld, is_list, enum_type in cls._get_value_specs():
+            value = getattr(args, fld.name)
+
+            if is_list:
+                if value is None:
+                    if fld.positional:
+                        raise ValueError(
+                            " Positional lists should never be able to be None" +
+                            " from argparse. Please report an issue w/ the mainter"
+                        )
+                    else:
+                        value = fld.get_default()
+                elif isinstance(value, list) and len(value) == 0:
+                    if fld.positional:
+                        value = fld.get_default()
+                    elif fld.optional:
+                        value = None
+
+            elif enum_type is not None and value is not None:
+                try:
+                    value = enum_type(value)
+                except ValueError:
+                    value = enum_type[value]
+
+            arg_dict[fld.name] = value
+
+        return cls(**arg_dict)
+
+    @classmethod
+    def parse_args(cls: Type[CommandT], args: Sequence[str] | None = None) -> CommandT:
+        """Parse the given args and create the command instance
+
+        The parser is built once per class, so sub-commands registered after the first call
+        are not picked up; use create_parser to build a parser of the current sub_commands.
+
+        Args:
+            cls (Type[CommandT]): The command type to parse and create
+            args (Sequence[str] | None, optional): The arg provided.
+                Operates as ArgumentParser.parse_args. Defaults to None.
+
+        Returns:
+            CommandT: The command type provided as cls
+        """
+        parser = cls._get_parser()
+        # argcomplete only acts when the shell completion hook sets _ARGCOMPLETE
+        if "_ARGCOMPLETE" in os.environ:
+            argcomplete = _get_argcomplete()
+            if argcomplete is not None:
+                argcomplete.autocomplete(parser)
+        parsed_args = parser.parse_args(args)
+        return cls.from_args(parsed_args)
+
+
+    @classmethod
+    def execute(cls: Type[CommandT]) -> NoReturn:
+        """Execute the command and exit with the return code
+        """
+        cmd = cls.parse_args()
+        exit(cmd())
+
+
+#####################################################################################
+# Command Decorator
+#####################################################################################
+_T = TypeVar("_T")
+_FuncT = TypeVar("_FuncT", bound=Callable[..., Any])
+
+if TYPE_CHECKING:
+    from typing_extensions import dataclass_transform
+elif sys.version_info >= (3, 11):
+    from typing import dataclass_transform
+else:
+    def dataclass_transform(**kwargs: Any) -> Callable[[_FuncT], _FuncT]:
+        """Stand-in for typing.dataclass_transform, which only informs type-checkers"""
+        return lambda func: func
+
+
+@overload
+def dataclass(cls: Type[_T], **kwargs: Any) -> Type[_T]:
+    ...
+
+
+@overload
+def dataclass(cls: None = None, **kwargs: Any) -> Callable[[Type[_T]], Type[_T]]:
+    ...
+
+
+@dataclass_transform(field_specifiers=(arg,))
+def dataclass(
+            cls: Type[_T] | None = None,
+            **kwargs: Any
+        ) -> Type[_T] | Callable[[Type[_T]], Type[_T]]:
+    """Drop-in replacement for dataclasses.dataclass to use on Command classes
+
+    In addition to the regular dataclass processing the argparse and from_args
+    specifications of the command are computed at decoration time. Building the parser
+    then only replays them and invalid arguments are reported as soon as the class is
+    defined.
+
+    Args:
+        cls (Type[_T] | None, optional): The class to decorate. None when the decorator is
+            called with keyword arguments only. Defaults to None.
+        **kwargs (Any): Keyword arguments passed on to dataclasses.dataclass
+
+    Returns:
+        Type[_T] | Callable[[Type[_T]], Type[_T]]: The dataclass, or the decorator creating
+            it when cls is None
+    """
+    def wrap(cls: Type[_T]) -> Type[_T]:
+        cls = dataclasses.dataclass(cls, **kwargs)
+        if issubclass(cls, Command):
+            cls._get_argspecs()
+            cls._get_value_specs()
+        return cls
+
+    if cls is None:
+        return wrap
+    return wrap(cls)
+
+
+#####################################################################################
+# Type Information
+#####################################################################################
+CommandT = TypeVar("CommandT", bound="Command")
@@ -0,0 +1,28 @@
+#####################################################################################
+# A package to simplify the creation of Python Command-Line tools
+# Copyright (C) 2023  Benjamin Davis
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; If not, see <https://www.gnu.org/licenses/>.
+#####################################################################################
+
+from __future__ import annotations
+
+
+#####################################################################################
+# Error Information
+#####################################################################################
+class InvalidArgumentError(Exception):
+    """Error raised when an invalid argument is passed to a command
+    """
+    pass
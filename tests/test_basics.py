@@ -20,13 +20,20 @@ from __future__ import annotations
 import sys
 
 from enum import Enum
-from command_creator import Command, arg
-from dataclasses import dataclass
+import command_creator as cc
+from command_creator import Command, arg, InvalidArgumentError
+from dataclasses import dataclass, field
+from typing import ClassVar
 import argparse
 
 import pytest
 
 
+def test_arg_slots() -> None:
+    # dataclasses.Field declares __slots__, so CmdArgument should not grow a __dict__
+    assert not hasattr(arg(), "__dict__")
+
+
 def test_arg_help() -> None:
     @dataclass
     class _TmpCmd(Command):
@@ -79,19 +86,29 @@ def test_arg_choices_enum() -> None:
         def __call__(self) -> int:
             return 0
 
-    for action in _TmpCmd.create_parser()._actions:
+    parser = _TmpCmd.create_parser()
+    for action in parser._actions:
         if action.dest == "opt":
             assert action.choices is not None
             assert set(action.choices) == {"A", "B", "C"}
 
-    args = _TmpCmd.create_parser().parse_args("B".split())
+    args = parser.parse_args("B".split())
     assert args.opt == 'B'
 
     cmd = _TmpCmd.from_args(args)
     assert cmd.opt == _TmpEnum.B
 
     with pytest.raises(SystemExit):
-        args = _TmpCmd.create_parser().parse_args("D".split())
+        args = parser.parse_args("D".split())
+
+
+def test_arg_choices_invalid() -> None:
+    @dataclass
+    class _TmpCmd(Command):
+        opt: str = arg(choices=("a", "b"))  # type: ignore[arg-type]
+
+    with pytest.raises(ValueError):
+        _TmpCmd.create_parser()
 
 
 def test_arg_optional() -> None:
@@ -158,19 +175,20 @@ def test_arg_positional() -> None:
         opt1: str = arg(positional=True)
         opt2: str = arg(positional=True, default="default_opt2", optional=True)
 
-    for action in _TmpCmd.create_parser()._actions:
+    parser = _TmpCmd.create_parser()
+    for action in parser._actions:
         if action.dest == "help":
             continue
         assert len(action.option_strings) == 0
 
     with pytest.raises(SystemExit):
-        args = _TmpCmd.create_parser().parse_args("".split())
+        args = parser.parse_args("".split())
 
-    args = _TmpCmd.create_parser().parse_args("given_opt1".split())
+    args = parser.parse_args("given_opt1".split())
     assert args.opt1 == "given_opt1"
     assert args.opt2 == "default_opt2"
 
-    args = _TmpCmd.create_parser().parse_args("given_opt1 given_opt2".split())
+    args = parser.parse_args("given_opt1 given_opt2".split())
     assert args.opt1 == "given_opt1"
     assert args.opt2 == "given_opt2"
 
@@ -180,10 +198,11 @@ def test_arg_count() -> None:
     class _TmpCmd(Command):
         opt: int = arg(count=True)
 
-    _TmpCmd.create_parser().print_help()
-    args = _TmpCmd.create_parser().parse_args(["--opt"] * 5)
+    parser = _TmpCmd.create_parser()
+    parser.print_help()
+    args = parser.parse_args(["--opt"] * 5)
     assert args.opt == 5
-    args = _TmpCmd.create_parser().parse_args(["--opt"] * 7)
+    args = parser.parse_args(["--opt"] * 7)
     assert args.opt == 7
 
 
@@ -204,12 +223,13 @@ def test_arg_completer_dict() -> None:
     class _TmpCmd(Command):
         opt: int = arg(completer={0: "Zero", 1: "One"})
 
-    for action in _TmpCmd.create_parser()._actions:
+    parser = _TmpCmd.create_parser()
+    for action in parser._actions:
         if action.dest == "opt":
             assert action.completer(  # type:ignore[attr-defined]
                 prefix="",
                 action=action,
-                parser=_TmpCmd.create_parser(),
+                parser=parser,
                 parsed_args=argparse.Namespace()
             ) == {0: "Zero", 1: "One"}
             assert action.metavar == "OPT"
@@ -229,12 +249,13 @@ def test_arg_completer_callable() -> None:
     class _TmpCmd(Command):
         opt: str = arg(completer=_tmp_completer)
 
-    for action in _TmpCmd.create_parser()._actions:
+    parser = _TmpCmd.create_parser()
+    for action in parser._actions:
         if action.dest == "opt":
             assert action.completer(  # type:ignore[attr-defined]
                 prefix="",
                 action=action,
-                parser=_TmpCmd.create_parser(),
+                parser=parser,
                 parsed_args=argparse.Namespace()
             ) == {f"c{i}": f"Choice {i}" for i in range(10)}
             assert action.metavar == "OPT"
@@ -248,3 +269,247 @@ def test_arg_completer_callable() -> None:
     for action in _TmpCmd.create_parser()._actions:
         if action.dest == "opt":
             assert action.metavar == "SOME_META"
+
+
+def test_cmd_args_per_class() -> None:
+    @dataclass
+    class _TmpCmd(Command):
+        opt1: str = arg(default="")
+
+    @dataclass
+    class _TmpSubCmd(_TmpCmd):
+        opt2: str = arg(default="")
+        tmp_class_var: ClassVar[int] = 0
+
+    assert [fld.name for fld in _TmpCmd._get_cmd_args()] == ["opt1"]
+    assert [fld.name for fld in _TmpSubCmd._get_cmd_args()] == ["opt1", "opt2"]
+    assert _TmpCmd._get_cmd_args() is _TmpCmd._get_cmd_args()
+
+
+def test_create_parser_cached() -> None:
+    @dataclass
+    class _TmpCmd(Command):
+        opt1: str = arg(default="")
+
+        def __call__(self) -> int:
+            return 0
+
+    @dataclass
+    class _TmpSubCmd(_TmpCmd):
+        opt2: str = arg(default="")
+
+    assert _TmpCmd._get_parser() is _TmpCmd._get_parser()
+    assert _TmpSubCmd._get_parser() is not _TmpCmd._get_parser()
+    assert _TmpSubCmd.create_parser().parse_args("--opt2 val".split()).opt2 == "val"
+
+    # create_parser hands out a new parser, so modifying it leaves the cache untouched
+    parser = _TmpCmd.create_parser()
+    assert parser is not _TmpCmd.create_parser()
+    parser.add_argument("--verbose", action="store_true")
+    assert parser.parse_args(["--verbose"]).verbose
+    with pytest.raises(SystemExit):
+        _TmpCmd.create_parser().parse_args(["--verbose"])
+    with pytest.raises(SystemExit):
+        _TmpCmd.parse_args(["--verbose"])
+
+
+def test_sub_commands_late() -> None:
+    @dataclass
+    class _TmpLate(Command):
+        opt1: str = arg(default="")
+
+        def __call__(self) -> int:
+            return 0
+
+    @dataclass
+    class _TmpCmd(Command):
+        sub_commands: ClassVar = {}
+
+        def __call__(self) -> int:
+            return 0
+
+    assert _TmpCmd.parse_args([]).sub_command is None
+
+    # parse_args keeps the parser of the first call, create_parser sees the late sub-command
+    _TmpCmd.sub_commands["late"] = _TmpLate
+    with pytest.raises(SystemExit):
+        _TmpCmd.parse_args("late --opt1 val".split())
+
+    cmd = _TmpCmd.from_args(_TmpCmd.create_parser().parse_args("late --opt1 val".split()))
+    assert isinstance(cmd.sub_command, _TmpLate)
+    assert cmd.sub_command.opt1 == "val"
+
+
+def test_cc_dataclass() -> None:
+    @cc.dataclass
+    class _TmpCmd(Command):
+        opt: str = arg(default="", help="Test opt help")
+
+        def __call__(self) -> int:
+            return 0
+
+    assert "dataclass" in cc.__all__
+    assert "_cc_argspecs" in _TmpCmd.__dict__
+    assert _TmpCmd(sub_command=None, opt="val").opt == "val"
+    assert _TmpCmd.create_parser().parse_args("--opt val".split()).opt == "val"
+
+    with pytest.raises(InvalidArgumentError):
+        @cc.dataclass
+        class _BadCmd(Command):
+            opt: str = field(default="")
+
+
+def test_cc_dataclass_without_argcomplete(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("command_creator._core._get_argcomplete", lambda: None)
+
+    # Decoration only computes the specs, the missing package is reported by create_parser
+    @cc.dataclass
+    class _TmpCmd(Command):
+        opt: str = arg(default="", completer=["a", "b"])
+
+        def __call__(self) -> int:
+            return 0
+
+    with pytest.raises(ValueError):
+        _TmpCmd.create_parser()
+
+
+def test_sub_commands_nested() -> None:
+    @dataclass
+    class _TmpLeaf(Command):
+        opt1: str = arg(default="")
+
+        def __call__(self) -> int:
+            return 0
+
+    @dataclass
+    class _TmpMid(Command):
+        sub_commands = {"leaf": _TmpLeaf}
+        opt2: str = arg(default="")
+
+        def __call__(self) -> int:
+            return 0
+
+    @dataclass
+    class _TmpCmd(Command):
+        sub_commands = {"mid": _TmpMid, "other": _TmpLeaf}
+
+        def __call__(self) -> int:
+            return 0
+
+    cmd = _TmpCmd.parse_args("mid --opt2 val2 leaf --opt1 val1".split())
+    assert isinstance(cmd.sub_command, _TmpMid)
+    assert cmd.sub_command.opt2 == "val2"
+    assert isinstance(cmd.sub_command.sub_command, _TmpLeaf)
+    assert cmd.sub_command.sub_command.opt1 == "val1"
+
+    cmd = _TmpCmd.parse_args("mid".split())
+    assert isinstance(cmd.sub_command, _TmpMid)
+    assert cmd.sub_command.sub_command is None
+
+    cmd = _TmpCmd.parse_args("other".split())
+    assert isinstance(cmd.sub_command, _TmpLeaf)
+
+    cmd = _TmpCmd.parse_args([])
+    assert cmd.sub_command is None
+
+    cmd = _TmpMid.from_args(_TmpCmd.create_parser().parse_args("mid leaf".split()))
+    assert isinstance(cmd, _TmpMid)
+    assert isinstance(cmd.sub_command, _TmpLeaf)
+
+    with pytest.raises(TypeError):
+        Command.sub_commands["tmp"] = _TmpLeaf  # type: ignore[index]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10")
+def test_command_slots() -> None:
+    @dataclass(slots=True)
+    class _TmpCmd(Command):
+        opt: str = arg(default="")
+
+        def __call__(self) -> int:
+            return 0
+
+    cmd = _TmpCmd.parse_args("--opt val".split())
+    assert cmd.opt == "val"
+    assert not hasattr(cmd, "__dict__")
+
+
+def test_sub_command_from_parent_args() -> None:
+    @dataclass
+    class _TmpLeaf(Command):
+        opt1: str = arg(default="")
+
+        def __call__(self) -> int:
+            return 0
+
+    @dataclass
+    class _TmpCmd(Command):
+        sub_commands = {"leaf": _TmpLeaf}
+
+        def __call__(self) -> int:
+            return 0
+
+    args = _TmpCmd.create_parser().parse_args("leaf --opt1 val1".split())
+    assert vars(args) == {"sub_command": "leaf", "opt1": "val1"}
+
+    cmd = _TmpLeaf.from_args(args)
+    assert isinstance(cmd, _TmpLeaf)
+    assert cmd.opt1 == "val1"
+
+    cmd = _TmpCmd.sub_commands[args.sub_command].from_args(args)
+    assert isinstance(cmd, _TmpLeaf)
+
+    # A sub-command may reuse the name under which it is registered for its own sub-command
+    @dataclass
+    class _TmpInner(Command):
+        opt2: str = arg(default="")
+
+        def __call__(self) -> int:
+            return 0
+
+    @dataclass
+    class _TmpMid(Command):
+        sub_commands = {"a": _TmpInner}
+
+        def __call__(self) -> int:
+            return 0
+
+    @dataclass
+    class _TmpRoot(Command):
+        sub_commands = {"a": _TmpMid}
+
+        def __call__(self) -> int:
+            return 0
+
+    parser = _TmpRoot.create_parser()
+    cmd = _TmpMid.from_args(parser.parse_args(["a"]))
+    assert isinstance(cmd, _TmpMid)
+    assert cmd.sub_command is None
+
+    args = parser.parse_args("a a --opt2 val2".split())
+    cmd = _TmpMid.from_args(args)
+    assert isinstance(cmd.sub_command, _TmpInner)
+    assert cmd.sub_command.opt2 == "val2"
+    root = _TmpRoot.from_args(args)
+    assert isinstance(root.sub_command, _TmpMid)
+    assert isinstance(root.sub_command.sub_command, _TmpInner)
+
+
+def test_sub_commands_cyclic() -> None:
+    @dataclass
+    class _TmpCmdA(Command):
+        def __call__(self) -> int:
+            return 0
+
+    @dataclass
+    class _TmpCmdB(Command):
+        sub_commands = {"a": _TmpCmdA}
+
+        def __call__(self) -> int:
+            return 0
+
+    _TmpCmdA.sub_commands = {"b": _TmpCmdB}
+
+    with pytest.raises(ValueError, match="cyclic sub_commands"):
+        _TmpCmdA.create_parser()
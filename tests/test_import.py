@@ -16,8 +16,46 @@
 # License along with this library; If not, see <https://www.gnu.org/licenses/>.
 #####################################################################################
 
+import subprocess
+import sys
+import typing
+from dataclasses import dataclass
+
+import pytest
+
+import command_creator as cc
 import command_creator._info
 
 
 def test_import():
     print(command_creator._info)
+
+
+def test_import_lazy() -> None:
+    # A fresh interpreter, as the test session itself has long imported argparse
+    code = (
+        "import sys, command_creator; "
+        "print('argparse' in sys.modules, 'command_creator._core' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert out.split() == ["False", "False"]
+
+
+def test_type_hints() -> None:
+    assert "parser" in typing.get_type_hints(cc.CompleterArgs)
+    assert "return" in typing.get_type_hints(cc.Command.create_parser)
+    assert "args" in typing.get_type_hints(cc.Command.from_args)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="X | None hints need Python 3.10")
+def test_type_hints_subclass() -> None:
+    @dataclass
+    class _TmpCmd(cc.Command):
+        opt: str = cc.arg(default="")
+
+        def __call__(self) -> int:
+            return 0
+
+    assert "opt" in typing.get_type_hints(_TmpCmd, localns={"_TmpCmd": _TmpCmd})
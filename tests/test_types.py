@@ -19,7 +19,11 @@
 from __future__ import annotations
 
 from command_creator import Command, arg
+from command_creator._core import _classify
 from dataclasses import dataclass
+from typing import List, Optional
+import sys
+import typing as t
 
 import pytest
 
@@ -84,3 +88,44 @@ def test_list_arg_positional_default() -> None:
     tmp = _TmpCmd.parse_args("".split())
     assert isinstance(tmp.opt1, list)
     assert len(tmp.opt1) == 0
+
+
+@pytest.mark.parametrize("hint,expected", [
+    ("str", (str, False)),
+    ("int | None", (int, False)),
+    ("Optional[float]", (float, False)),
+    ("list[str] | None", (str, True)),
+    ("typing.List[int]", (int, True)),
+    ("t.Optional[int]", (int, False)),
+    ("typing_extensions.Optional[str]", (str, False)),
+    ("Annotated[int, 'meta']", (int, False)),
+    ("t.Annotated[list[float], 'meta'] | None", (float, True)),
+    ("mod.SomeEnum", (None, False)),
+    ("SomeEnum", (None, False)),
+    ("str | int", (None, False)),
+    (bool, (bool, False)),
+    (Optional[int], (int, False)),
+    (List[str], (str, True)),
+    (List, (None, True)),
+    (Optional[List[float]], (float, True)),
+])
+def test_classify(hint: object, expected: tuple[type | None, bool]) -> None:
+    assert _classify(hint) == expected
+
+
+@pytest.mark.skipif(sys.version_info < (3, 9), reason="typing.Annotated needs Python 3.9")
+def test_classify_annotated() -> None:
+    from typing import Annotated
+    assert _classify(Annotated[int, "meta"]) == (int, False)
+    assert _classify(Optional[Annotated[List[str], "meta"]]) == (str, True)
+
+
+def test_qualified_hint() -> None:
+    @dataclass
+    class _TmpCmd(Command):
+        opt1: t.Optional[int] = arg(default=None)
+
+        def __call__(self) -> int:
+            return 0
+
+    assert _TmpCmd.parse_args("--opt1 1".split()).opt1 == 1